@@ -2,6 +2,7 @@
 Configuration settings for ML Dashboard - Updated for CSV sensor data
 """
 from typing import Dict, List, Any
+from types import MappingProxyType
 
 class Config:
     """Application configuration"""
@@ -37,31 +38,34 @@ class Config:
         "Conference Space"
     ]
     
-    # Extended sensor parameters based on CSV data
-    SENSOR_PARAMETERS = {
+    # Extended sensor parameters based on CSV data (read-only)
+    SENSOR_PARAMETERS = MappingProxyType({
         # Primary environmental sensors
-        "co2": {"unit": "ppm", "display_name": "CO2", "color": "#FF6B6B"},
-        "temperature": {"unit": "°C", "display_name": "Temperature", "color": "#4ECDC4"},
-        "humidity": {"unit": "%", "display_name": "Humidity", "color": "#45B7D1"},
-        "pressure": {"unit": "hPa", "display_name": "Pressure", "color": "#96CEB4"},
+        "co2": MappingProxyType({"unit": "ppm", "display_name": "CO2", "color": "#FF6B6B"}),
+        "temperature": MappingProxyType({"unit": "°C", "display_name": "Temperature", "color": "#4ECDC4"}),
+        "humidity": MappingProxyType({"unit": "%", "display_name": "Humidity", "color": "#45B7D1"}),
+        "pressure": MappingProxyType({"unit": "hPa", "display_name": "Pressure", "color": "#96CEB4"}),
         
         # Air quality sensors
-        "iaq": {"unit": "IAQ", "display_name": "Indoor Air Quality", "color": "#FFEAA7"},
-        "voc": {"unit": "VOC", "display_name": "Volatile Organic Compounds", "color": "#DDA0DD"},
-        "gas_resistance": {"unit": "Ω", "display_name": "Gas Resistance", "color": "#98D8C8"},
+        "iaq": MappingProxyType({"unit": "IAQ", "display_name": "Indoor Air Quality", "color": "#FFEAA7"}),
+        "voc": MappingProxyType({"unit": "VOC", "display_name": "Volatile Organic Compounds", "color": "#DDA0DD"}),
+        "gas_resistance": MappingProxyType({"unit": "Ω", "display_name": "Gas Resistance", "color": "#98D8C8"}),
         
         # Gas sensors
-        "co": {"unit": "ppm", "display_name": "Carbon Monoxide", "color": "#F7DC6F"},
-        "nh3": {"unit": "ppm", "display_name": "Ammonia", "color": "#BB8FCE"},
-        "no2": {"unit": "ppm", "display_name": "Nitrogen Dioxide", "color": "#85C1E9"}
-    }
+        "co": MappingProxyType({"unit": "ppm", "display_name": "Carbon Monoxide", "color": "#F7DC6F"}),
+        "nh3": MappingProxyType({"unit": "ppm", "display_name": "Ammonia", "color": "#BB8FCE"}),
+        "no2": MappingProxyType({"unit": "ppm", "display_name": "Nitrogen Dioxide", "color": "#85C1E9"})
+    })
     
-    # Parameter groups for UI organization
-    PARAMETER_GROUPS = {
-        "Environmental": ["temperature", "humidity", "pressure"],
-        "Air Quality": ["co2", "iaq", "voc"],
-        "Gas Detection": ["co", "nh3", "no2", "gas_resistance"]
-    }
+    # Unit per parameter, resolved once for the data hot paths
+    UNIT_BY_PARAMETER = MappingProxyType({p: v.get("unit", "") for p, v in SENSOR_PARAMETERS.items()})
+    
+    # Parameter groups for UI organization (read-only)
+    PARAMETER_GROUPS = MappingProxyType({
+        "Environmental": ("temperature", "humidity", "pressure"),
+        "Air Quality": ("co2", "iaq", "voc"),
+        "Gas Detection": ("co", "nh3", "no2", "gas_resistance")
+    })
     
     # Model Configuration
     MODEL_CONFIG = {
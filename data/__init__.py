@@ -1 +1,25 @@
 """Data access layer"""
+import importlib
+
+# Provider classes are imported on first attribute access (PEP 562) so that
+# importing the package doesn't load pandas/requests until a provider is needed
+_LAZY_ATTRS = {
+    "DataProviderFactory": ".connector",
+    "DataProcessor": ".processor",
+    "HomeAssistantConnector": ".homeassistant_connector",
+    "MockDataProvider": ".mock_provider",
+    "PredictionData": ".models",
+    "SensorReading": ".models",
+    "SensorSeries": ".models",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,19 +1,24 @@
 """Data connectors and provider factory"""
 from abc import ABC, abstractmethod
-from typing import List, Protocol
+from typing import List, Protocol, TYPE_CHECKING
 from datetime import datetime
 import streamlit as st
 
-from .models import SensorReading
-from .homeassistant_connector import HomeAssistantConnector
-from .mock_provider import MockDataProvider
+from .models import SensorSeries
 from config.settings import Config
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 class DataProvider(Protocol):
     """Data provider interface"""
     
     def fetch_sensor_data(self, room: str, parameter: str, 
-                         start_time: datetime, end_time: datetime) -> List[SensorReading]:
+                         start_time: datetime, end_time: datetime) -> SensorSeries:
+        ...
+    
+    def fetch_sensor_dataframe(self, room: str, parameter: str, 
+                              start_time: datetime, end_time: datetime) -> "pd.DataFrame":
         ...
     
     def get_available_rooms(self) -> List[str]:
@@ -31,6 +36,9 @@ class DataProviderFactory:
     @staticmethod
     def create_provider() -> DataProvider:
         """Create data provider with automatic fallback"""
+        # Imported here so importing this module doesn't pull in requests/CSV loading
+        from .homeassistant_connector import HomeAssistantConnector
+        from .mock_provider import MockDataProvider
         
         # Try HomeAssistant connection first
         ha_connector = HomeAssistantConnector(
@@ -6,7 +6,15 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime
 from typing import Optional
+from config.settings import Config
 
+# Providers hold the loaded data, so hash them by identity instead of by content
+_PROVIDER_HASH_FUNCS = {
+    "data.mock_provider.MockDataProvider": id,
+    "data.homeassistant_connector.HomeAssistantConnector": id,
+}
+
+@st.cache_data(ttl=Config.APP_CONFIG["cache_ttl_seconds"], hash_funcs=_PROVIDER_HASH_FUNCS)
 def load_sensor_data(data_provider, room: str, parameter: str) -> Optional[pd.DataFrame]:
     """Load sensor data from the provider and convert to DataFrame"""
     try:
@@ -14,6 +22,10 @@ def load_sensor_data(data_provider, room: str, parameter: str) -> Optional[pd.Da
         start_time = datetime(2024, 9, 24)
         end_time = datetime(2025, 5, 6)
         
+        if hasattr(data_provider, 'fetch_sensor_dataframe'):
+            df = data_provider.fetch_sensor_dataframe(room, parameter, start_time, end_time)
+            return df if not df.empty else None
+        
         historical_data = data_provider.fetch_sensor_data(room, parameter, start_time, end_time)
         
         if not historical_data:
@@ -35,11 +47,8 @@ def load_sensor_data(data_provider, room: str, parameter: str) -> Optional[pd.Da
         st.error(f"Error loading data: {e}")
         return None
 
+@st.cache_resource(show_spinner="Loading data...")
 def setup_data_provider():
     """Setup and cache the data provider"""
-    if st.session_state.data_provider is None:
-        with st.spinner("Loading data..."):
-            from data.connector import DataProviderFactory
-            st.session_state.data_provider = DataProviderFactory.create_provider()
-    
-    return st.session_state.data_provider
\ No newline at end of file
+    from data.connector import DataProviderFactory
+    return DataProviderFactory.create_provider()
@@ -1,10 +1,15 @@
 """HomeAssistant API connector"""
-from typing import List
+from typing import List, Optional
 from datetime import datetime
+import pandas as pd
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+import time
 
-from .models import SensorReading
+from .models import SensorSeries
 from config.settings import Config
 
 logger = logging.getLogger(__name__)
@@ -21,13 +26,52 @@ class HomeAssistantConnector:
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json"
         }
+        
+        # Pooled session so repeated API calls reuse the same connection
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(self.headers)
+        
+        # The connection test fails routinely (we then fall back to mock
+        # data), so it gets its own session without retries - one timeout,
+        # not one per retry
+        self._probe_session = requests.Session()
+        self._probe_session.mount("http://", HTTPAdapter(max_retries=0))
+        self._probe_session.mount("https://", HTTPAdapter(max_retries=0))
+        self._probe_session.headers.update(self.headers)
+        
+        # Cached result of the last connection test
+        self._conn_ok = False
+        self._conn_checked_at: Optional[float] = None
     
     def fetch_sensor_data(self, room: str, parameter: str, 
-                         start_time: datetime, end_time: datetime) -> List[SensorReading]:
+                         start_time: datetime, end_time: datetime) -> SensorSeries:
         """Fetch sensor data from HomeAssistant"""
         # TODO: Implement actual API calls
         logger.info(f"Fetching {parameter} data for {room} from {start_time} to {end_time}")
-        return []
+        return SensorSeries(
+            room=room,
+            parameter=parameter,
+            unit=Config.UNIT_BY_PARAMETER.get(parameter, ""),
+            timestamps=np.array([], dtype='datetime64[ns]'),
+            values=np.array([], dtype=np.float32)
+        )
+    
+    def fetch_sensor_dataframe(self, room: str, parameter: str, 
+                              start_time: datetime, end_time: datetime) -> pd.DataFrame:
+        """Fetch sensor data from HomeAssistant as a timestamp/value/unit DataFrame"""
+        series = self.fetch_sensor_data(room, parameter, start_time, end_time)
+        return pd.DataFrame({
+            'timestamp': series.timestamps,
+            'value': series.values,
+            'unit': series.unit
+        })
     
     def get_available_rooms(self) -> List[str]:
         """Get available rooms from HomeAssistant"""
@@ -38,18 +82,33 @@ class HomeAssistantConnector:
         return list(Config.SENSOR_PARAMETERS.keys()) if self.is_connected() else []
     
     def is_connected(self) -> bool:
-        """Check if connected to HomeAssistant"""
+        """Check if connected to HomeAssistant (cached for cache_ttl_seconds)"""
+        if self._conn_checked_at is not None and time.monotonic() - self._conn_checked_at < Config.APP_CONFIG["cache_ttl_seconds"]:
+            return self._conn_ok
         return self.test_connection()
     
     def test_connection(self) -> bool:
         """Test connection to HomeAssistant"""
         try:
-            response = requests.get(
+            response = self._probe_session.get(
                 f"{self.base_url}/",
-                headers=self.headers,
                 timeout=Config.HOMEASSISTANT_CONFIG["timeout"]
             )
-            return response.status_code == 200
+            self._conn_ok = response.status_code == 200
         except Exception as e:
             logger.warning(f"HomeAssistant connection failed: {e}")
-            return False
+            self._conn_ok = False
+        
+        self._conn_checked_at = time.monotonic()
+        return self._conn_ok
+    
+    def close(self):
+        """Close the pooled HTTP sessions"""
+        self.session.close()
+        self._probe_session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,40 +1,58 @@
 """Mock data provider for development - Updated to use real CSV data"""
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Set, Tuple
+from types import MappingProxyType
+from datetime import datetime
 import pandas as pd
 import numpy as np
 import os
+import hashlib
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from .models import SensorReading
+from .models import SensorSeries
 from config.settings import Config
 
 logger = logging.getLogger(__name__)
 
+# Map standard parameter names to CSV column names
+_SENSOR_MAPPING = MappingProxyType({
+    "co2": "SCD30_CO2",
+    "temperature": "SCD30_Temperature", 
+    "humidity": "SCD30_Humidity",
+    "pressure": "BME680_Pressure",
+    "iaq": "BME680_IAQ",
+    "voc": "BME680_Breath_VOC_Equivalent",
+    "gas_resistance": "BME680_Gas_Resistance",
+    "co": "MICS6814_CO",
+    "nh3": "MICS6814_NH3",
+    "no2": "MICS6814_NO2"
+})
+
+# Only these CSV columns are ever read
+_WANTED_COLUMNS = ("time", *_SENSOR_MAPPING.values())
+
+# Bump whenever _preprocess_dataframe changes so stale cache files are rebuilt
+_CACHE_VERSION = 3
+
+def _preprocess_settings_digest() -> str:
+    """Short digest of the settings baked into cached frames (columns, clamp ranges)"""
+    settings = json.dumps([_WANTED_COLUMNS, Config.DATA_VALIDATION], sort_keys=True)
+    return hashlib.sha1(settings.encode(), usedforsecurity=False).hexdigest()[:12]
+
 class MockDataProvider:
     """Mock data provider using real CSV sensor data"""
     
+    sensor_mapping = _SENSOR_MAPPING
+    
     def __init__(self):
         self.data_cache: Dict[str, pd.DataFrame] = {}
-        self.sensor_mapping = self._create_sensor_mapping()
+        self.arrays: Dict[str, Dict[str, Tuple[np.ndarray, np.ndarray]]] = {}
+        self.non_empty_cols: Dict[str, Set[str]] = {}
+        self.column_stats: Dict[str, Dict[str, Tuple[int, int]]] = {}
         self._load_csv_files()
     
-    def _create_sensor_mapping(self) -> Dict[str, str]:
-        """Map standard parameter names to CSV column names"""
-        return {
-            "co2": "SCD30_CO2",
-            "temperature": "SCD30_Temperature", 
-            "humidity": "SCD30_Humidity",
-            "pressure": "BME680_Pressure",
-            "iaq": "BME680_IAQ",
-            "voc": "BME680_Breath_VOC_Equivalent",
-            "gas_resistance": "BME680_Gas_Resistance",
-            "co": "MICS6814_CO",
-            "nh3": "MICS6814_NH3",
-            "no2": "MICS6814_NO2"
-        }
-    
     def _load_csv_files(self):
         """Load all CSV files from the mock_data directory"""
         mock_data_dir = Path(__file__).parent / "mock_data"
@@ -46,19 +64,71 @@ class MockDataProvider:
         csv_files = list(mock_data_dir.glob("*.csv"))
         logger.info(f"Found {len(csv_files)} CSV files in {mock_data_dir}")
         
-        for csv_file in csv_files:
+        if not csv_files:
+            return
+        
+        # Parse files concurrently; pandas/pyarrow release the GIL while reading
+        with ThreadPoolExecutor(max_workers=min(8, len(csv_files))) as executor:
+            results = list(executor.map(self._load_one_csv, csv_files))
+        
+        for result in results:
+            if result is None:
+                continue
+            room_name, df = result
+            self.data_cache[room_name] = df
+            self.arrays[room_name] = self._build_arrays(df)
+            self.non_empty_cols[room_name] = {c for c in df.columns if df[c].notna().any()}
+            self.column_stats[room_name] = {
+                c: (int(df[c].count()), int(df[c].isna().sum()))
+                for c in df.select_dtypes(include=[np.number]).columns
+            }
+    
+    def _load_one_csv(self, csv_file: Path) -> Optional[Tuple[str, pd.DataFrame]]:
+        """Load one CSV file, returning (room_name, preprocessed_df) or None on error"""
+        try:
+            # Extract room name from filename (e.g., "Multisensor_104" -> "Sensor 104")
+            room_name = self._extract_room_name(csv_file.name)
+            
+            df = self._read_preprocessed(csv_file)
+            logger.info(f"Loaded {len(df)} rows from {csv_file.name} for room '{room_name}'")
+            return room_name, df
+            
+        except Exception as e:
+            logger.error(f"Error loading {csv_file}: {e}")
+            return None
+    
+    def _read_preprocessed(self, csv_file: Path) -> pd.DataFrame:
+        """Read and preprocess a CSV file, reusing the Feather cache when it is fresh"""
+        stat = csv_file.stat()
+        # Cached frames depend on the CSV and on the settings used to preprocess it
+        key = f"v{_CACHE_VERSION}_{_preprocess_settings_digest()}_{stat.st_mtime_ns}_{stat.st_size}"
+        cache_dir = csv_file.parent / ".cache"
+        cache_file = cache_dir / f"{csv_file.stem}.{key}.feather"
+        
+        if cache_file.exists():
             try:
-                # Extract room name from filename (e.g., "Multisensor_104" -> "Sensor 104")
-                room_name = self._extract_room_name(csv_file.name)
-                
-                df = pd.read_csv(csv_file)
-                df = self._preprocess_dataframe(df)
-                
-                self.data_cache[room_name] = df
-                logger.info(f"Loaded {len(df)} rows from {csv_file.name} for room '{room_name}'")
-                
+                return pd.read_feather(cache_file).set_index('time')
             except Exception as e:
-                logger.error(f"Error loading {csv_file}: {e}")
+                logger.warning(f"Ignoring unreadable cache {cache_file}: {e}")
+        
+        # Peek at the header so unused columns are never parsed, then let the
+        # pyarrow engine parse the timestamps natively while reading
+        header = pd.read_csv(csv_file, nrows=0).columns
+        usecols = [c for c in _WANTED_COLUMNS if c in header]
+        df = pd.read_csv(csv_file, engine='pyarrow', usecols=usecols, parse_dates=['time'])
+        df = self._preprocess_dataframe(df)
+        
+        try:
+            cache_dir.mkdir(exist_ok=True)
+            for stale in cache_dir.glob(f"{csv_file.stem}.*.feather"):
+                if stale != cache_file and stale.name.rsplit(".", 2)[0] == csv_file.stem:
+                    stale.unlink()
+            # Feather only stores a default index, so keep 'time' as a column on disk
+            df.reset_index().to_feather(cache_file)
+        except Exception as e:
+            logger.warning(f"Could not write cache {cache_file}: {e}")
+        
+        return df
     
     def _extract_room_name(self, filename: str) -> str:
         """Extract room name from CSV filename"""
@@ -75,85 +145,110 @@ class MockDataProvider:
     
     def _preprocess_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and preprocess the CSV data"""
-        # Convert time column to datetime and make timezone-naive
-        df['time'] = pd.to_datetime(df['time'])
+        # Make the (already parsed) time column timezone-naive nanoseconds
         if df['time'].dt.tz is not None:
             df['time'] = df['time'].dt.tz_localize(None)
-        df = df.sort_values('time')
+        df['time'] = df['time'].astype('datetime64[ns]')
         
         # Remove rows where time is null
         df = df.dropna(subset=['time'])
+        df = df.sort_values('time')
+        
+        # Sorted DatetimeIndex: O(1) bounds for get_data_summary and the sorted
+        # timestamps _build_arrays searches; the Feather cache round-trips it
+        df = df.set_index('time')
+        assert df.index.is_monotonic_increasing
         
         # Fill forward numeric columns to handle missing values
         numeric_columns = df.select_dtypes(include=[np.number]).columns
         df[numeric_columns] = df[numeric_columns].ffill()
         
+        # Clamp to the configured sensor ranges
+        for param, limits in Config.DATA_VALIDATION.items():
+            csv_col = self.sensor_mapping.get(param)
+            if csv_col in df.columns:
+                df[csv_col] = df[csv_col].clip(limits["min"], limits["max"])
+        
+        # Sensor readings carry only a few significant digits, float32 halves the memory
+        df[numeric_columns] = df[numeric_columns].astype(np.float32)
+        
         return df
     
+    def _build_arrays(self, df: pd.DataFrame) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Precompute sorted (timestamps, values) arrays per parameter with nulls dropped"""
+        timestamps = df.index.values.astype('datetime64[ns]')
+        arrays = {}
+        for param, csv_col in self.sensor_mapping.items():
+            if csv_col not in df.columns:
+                continue
+            values = df[csv_col].to_numpy(dtype=np.float32)
+            valid = ~np.isnan(values)
+            arrays[param] = (timestamps[valid], values[valid])
+        return arrays
+    
     def fetch_sensor_data(self, room: str, parameter: str, 
-                         start_time: datetime, end_time: datetime) -> List[SensorReading]:
-        """Fetch sensor data from loaded CSV files"""
+                         start_time: datetime, end_time: datetime) -> SensorSeries:
+        """Fetch sensor data from loaded CSV files as a SensorSeries"""
+        df = self.fetch_sensor_dataframe(room, parameter, start_time, end_time)
+        
+        series = SensorSeries(
+            room=room,
+            parameter=parameter,
+            unit=Config.UNIT_BY_PARAMETER.get(parameter, ""),
+            timestamps=df['timestamp'].to_numpy(dtype='datetime64[ns]'),
+            values=df['value'].to_numpy()
+        )
+        
+        logger.info(f"Returning {len(series)} readings for {room}/{parameter}")
+        return series
+    
+    def fetch_sensor_dataframe(self, room: str, parameter: str, 
+                              start_time: datetime, end_time: datetime) -> pd.DataFrame:
+        """Fetch sensor data from loaded CSV files as a timestamp/value/unit DataFrame"""
         
         if room not in self.data_cache:
             logger.warning(f"No data available for room: {room}")
             return self._generate_fallback_data(room, parameter, start_time, end_time)
         
-        df = self.data_cache[room]
-        
-        # Get the CSV column name for this parameter
+        # Get the precomputed arrays for this parameter
         csv_column = self.sensor_mapping.get(parameter)
-        if csv_column is None or csv_column not in df.columns:
+        if parameter not in self.arrays[room]:
             logger.warning(f"Parameter '{parameter}' (CSV column: {csv_column}) not found in data for room '{room}'")
-            logger.warning(f"Available columns: {list(df.columns)}")
+            logger.warning(f"Available columns: {list(self.data_cache[room].columns)}")
             return self._generate_fallback_data(room, parameter, start_time, end_time)
         
+        timestamps, values = self.arrays[room][parameter]
+        start_ts = self._to_datetime64(start_time)
+        end_ts = self._to_datetime64(end_time)
+        
         # Debug logging
         logger.info(f"Fetching {parameter} ({csv_column}) for {room}")
-        logger.info(f"Time range: {start_time} to {end_time}")
-        logger.info(f"DataFrame time range: {df['time'].min()} to {df['time'].max()}")
-        
-        # Ensure start_time and end_time are timezone-naive like our data
-        if start_time.tzinfo is not None:
-            start_time = start_time.replace(tzinfo=None)
-        if end_time.tzinfo is not None:
-            end_time = end_time.replace(tzinfo=None)
-        
-        # Filter by time range
-        mask = (df['time'] >= start_time) & (df['time'] <= end_time)
-        filtered_df = df.loc[mask]
-        logger.info(f"Rows after time filter: {len(filtered_df)}")
-        
-        # Check for non-null values in the parameter column
-        non_null_mask = filtered_df[csv_column].notna()
-        final_df = filtered_df.loc[non_null_mask]
-        logger.info(f"Rows with non-null {csv_column}: {len(final_df)}")
-        
-        # Convert to SensorReading objects
-        readings = []
-        unit = Config.SENSOR_PARAMETERS.get(parameter, {}).get("unit", "")
-        
-        for _, row in final_df.iterrows():
-            value = row[csv_column]
-            readings.append(SensorReading(
-                timestamp=row['time'].to_pydatetime(),
-                room=room,
-                parameter=parameter,
-                value=float(value),
-                unit=unit
-            ))
-        
-        logger.info(f"Returning {len(readings)} readings for {room}/{parameter}")
-        return readings
+        logger.info(f"Time range: {start_ts} to {end_ts}")
+        
+        # Binary search the sorted timestamps instead of masking the whole frame
+        lo = np.searchsorted(timestamps, start_ts, side='left')
+        hi = np.searchsorted(timestamps, end_ts, side='right')
+        logger.info(f"Rows with non-null {csv_column} in time range: {hi - lo}")
+        
+        return pd.DataFrame({
+            'timestamp': timestamps[lo:hi],
+            'value': values[lo:hi],
+            'unit': Config.UNIT_BY_PARAMETER.get(parameter, "")
+        })
+    
+    @staticmethod
+    def _to_datetime64(value: datetime) -> np.datetime64:
+        """Convert a time bound to timezone-naive datetime64[ns] like our data"""
+        if getattr(value, 'tzinfo', None) is not None:
+            value = value.replace(tzinfo=None)
+        return np.datetime64(value, 'ns')
     
     def _generate_fallback_data(self, room: str, parameter: str, 
-                               start_time: datetime, end_time: datetime) -> List[SensorReading]:
+                               start_time: datetime, end_time: datetime) -> pd.DataFrame:
         """Generate synthetic data when CSV data is not available"""
         logger.info(f"Generating fallback data for {room}/{parameter}")
         
-        # Generate data points every 5 minutes
-        current_time = start_time
-        readings = []
-        unit = Config.SENSOR_PARAMETERS.get(parameter, {}).get("unit", "")
+        unit = Config.UNIT_BY_PARAMETER.get(parameter, "")
         
         # Base values for different parameters
         base_values = {
@@ -167,25 +262,19 @@ class MockDataProvider:
         
         base_value = base_values.get(parameter, 50)
         
-        while current_time <= end_time:
-            # Simple sine wave with noise for realistic variation
-            hours_since_start = (current_time - start_time).total_seconds() / 3600
-            daily_cycle = np.sin(2 * np.pi * hours_since_start / 24) * 0.1
-            noise = np.random.normal(0, 0.05)
-            
-            value = base_value * (1 + daily_cycle + noise)
-            
-            readings.append(SensorReading(
-                timestamp=current_time,
-                room=room,
-                parameter=parameter,
-                value=value,
-                unit=unit
-            ))
-            
-            current_time += timedelta(minutes=5)
+        # Generate data points every 5 minutes from start_time through end_time
+        num_points = max(int((end_time - start_time).total_seconds() // 300) + 1, 0)
+        hours_since_start = np.arange(num_points) * (5 / 60)
         
-        return readings
+        # Simple sine wave with noise for realistic variation
+        daily_cycle = np.sin(2 * np.pi * hours_since_start / 24) * 0.1
+        noise = np.random.normal(0, 0.05, num_points)
+        
+        return pd.DataFrame({
+            'timestamp': pd.date_range(start_time, periods=num_points, freq='5min'),
+            'value': base_value * (1 + daily_cycle + noise),
+            'unit': unit
+        })
     
     def get_available_rooms(self) -> List[str]:
         """Get list of available rooms from loaded CSV data"""
@@ -200,12 +289,9 @@ class MockDataProvider:
     def get_available_parameters(self, room: str) -> List[str]:
         """Get available sensor parameters for a room"""
         if room in self.data_cache:
-            df = self.data_cache[room]
             # Find which mapped parameters have data in this CSV
-            available = []
-            for param, csv_col in self.sensor_mapping.items():
-                if csv_col in df.columns and not df[csv_col].isna().all():
-                    available.append(param)
+            non_empty = self.non_empty_cols.get(room, ())
+            available = [p for p, c in self.sensor_mapping.items() if c in non_empty]
             
             # Add any parameters that are configured but not in the mapping
             for param in Config.SENSOR_PARAMETERS.keys():
@@ -229,16 +315,16 @@ class MockDataProvider:
                 summary[room] = {
                     "row_count": len(df),
                     "time_range": {
-                        "start": df['time'].min().isoformat(),
-                        "end": df['time'].max().isoformat()
+                        "start": df.index[0].isoformat(),
+                        "end": df.index[-1].isoformat()
                     },
-                    "available_columns": [col for col in df.columns if col != 'time'],
+                    "available_columns": list(df.columns),
                     "data_quality": {
                         col: {
-                            "non_null_count": df[col].count(),
-                            "null_percentage": (df[col].isna().sum() / len(df)) * 100
+                            "non_null_count": non_null_count,
+                            "null_percentage": (null_count / len(df)) * 100
                         }
-                        for col in df.select_dtypes(include=[np.number]).columns
+                        for col, (non_null_count, null_count) in self.column_stats[room].items()
                     }
                 }
         
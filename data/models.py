@@ -1,9 +1,10 @@
 """Data models for the application"""
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple, Union
+import numpy as np
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SensorReading:
     """Represents a single sensor reading"""
     timestamp: datetime
@@ -12,6 +13,39 @@ class SensorReading:
     value: float
     unit: str
 
+@dataclass(slots=True, eq=False)
+class SensorSeries:
+    """Sensor readings for one room/parameter stored as column arrays
+    
+    Behaves like a sequence of SensorReading for existing callers, without
+    repeating room/parameter/unit for every reading.
+    """
+    room: str
+    parameter: str
+    unit: str
+    timestamps: np.ndarray  # datetime64[ns]
+    values: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    def __iter__(self) -> Iterator[SensorReading]:
+        timestamps = self.timestamps.astype('datetime64[us]').tolist()
+        for timestamp, value in zip(timestamps, self.values.tolist()):
+            yield SensorReading(timestamp, self.room, self.parameter, value, self.unit)
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[SensorReading, "SensorSeries"]:
+        if isinstance(index, slice):
+            return SensorSeries(self.room, self.parameter, self.unit,
+                                self.timestamps[index], self.values[index])
+        return SensorReading(
+            timestamp=self.timestamps[index].astype('datetime64[us]').item(),
+            room=self.room,
+            parameter=self.parameter,
+            value=float(self.values[index]),
+            unit=self.unit
+        )
+
 @dataclass
 class PredictionData:
     """Represents a prediction result"""
@@ -19,3 +53,26 @@ class PredictionData:
     predicted_value: float
     model_name: str
     confidence: Optional[float] = None
+
+def to_arrays(readings: Union[SensorSeries, List[SensorReading]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Timestamps (datetime64[ns]) and float values of readings, in time order"""
+    if isinstance(readings, SensorSeries):
+        timestamps = readings.timestamps.astype('datetime64[ns]', copy=False)
+        values = readings.values.astype(np.float64, copy=False)
+    else:
+        timestamps = np.array([r.timestamp for r in readings], dtype='datetime64[ns]')
+        values = np.array([r.value for r in readings], dtype=np.float64)
+    
+    # Providers return sorted readings; only sort if a caller's aren't
+    if len(timestamps) > 1 and (np.diff(timestamps) < np.timedelta64(0)).any():
+        order = np.argsort(timestamps, kind='stable')
+        timestamps, values = timestamps[order], values[order]
+    return timestamps, values
+
+def predictions_to_arrays(predictions: List[PredictionData]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Timestamps, predicted values and confidences (NaN where missing) of predictions, in list order"""
+    timestamps = np.array([p.timestamp for p in predictions], dtype='datetime64[ns]')
+    values = np.array([p.predicted_value for p in predictions], dtype=np.float64)
+    confidences = np.array([np.nan if p.confidence is None else p.confidence for p in predictions],
+                           dtype=np.float64)
+    return timestamps, values, confidences
@@ -1,31 +1,39 @@
 """Data processing utilities"""
 import pandas as pd
-from typing import List
-from .models import SensorReading
+import numpy as np
+from typing import List, Union
+from .models import SensorReading, SensorSeries
 
 class DataProcessor:
     """Data processing and validation utilities"""
     
     @staticmethod
-    def readings_to_dataframe(readings: List[SensorReading]) -> pd.DataFrame:
+    def readings_to_dataframe(readings: Union[SensorSeries, List[SensorReading]]) -> pd.DataFrame:
         """Convert sensor readings to pandas DataFrame"""
         if not readings:
             return pd.DataFrame()
         
-        data = []
-        for reading in readings:
-            data.append({
-                'timestamp': reading.timestamp,
-                'room': reading.room,
-                'parameter': reading.parameter,
-                'value': reading.value,
-                'unit': reading.unit
+        # Series are already columnar; room/parameter/unit broadcast as scalars
+        if isinstance(readings, SensorSeries):
+            return pd.DataFrame({
+                'timestamp': readings.timestamps,
+                'room': readings.room,
+                'parameter': readings.parameter,
+                'value': readings.values,
+                'unit': readings.unit
             })
         
-        return pd.DataFrame(data)
+        # Build column-wise rather than from a list of per-row dicts
+        return pd.DataFrame({
+            'timestamp': [r.timestamp for r in readings],
+            'room': [r.room for r in readings],
+            'parameter': [r.parameter for r in readings],
+            'value': np.fromiter((r.value for r in readings), dtype=np.float64, count=len(readings)),
+            'unit': [r.unit for r in readings]
+        })
     
     @staticmethod
-    def validate_data(readings: List[SensorReading]) -> bool:
+    def validate_data(readings: Union[SensorSeries, List[SensorReading]]) -> bool:
         """Validate sensor data quality"""
         if not readings:
             return False
@@ -92,8 +92,8 @@ def main():
         # Cutoff control slider BELOW the chart (aligned with chart timeline)
         cutoff_position = create_cutoff_control(chart_start_time, chart_end_time)
         
-        # Update session state and recreate chart if slider moved
-        if abs(cutoff_position - st.session_state.cutoff_position) > 0.01:
+        # Update session state and recreate chart if slider moved noticeably
+        if abs(cutoff_position - st.session_state.cutoff_position) > 0.02:
             st.session_state.cutoff_position = cutoff_position
             st.rerun()  # Rerun to update the chart
         
@@ -3,8 +3,9 @@ Base model class that all predictors inherit from
 """
 
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Tuple
 
 class BasePredictor(ABC):
@@ -36,12 +37,10 @@ class BasePredictor(ABC):
     def _generate_timestamps(self, cutoff_time: datetime, 
                            hours_ahead: int, num_points: int) -> List[datetime]:
         """Helper method to generate prediction timestamps"""
-        timestamps = []
-        for i in range(1, num_points + 1):
-            hours_offset = i * (hours_ahead / num_points)
-            timestamp = cutoff_time + timedelta(hours=hours_offset)
-            timestamps.append(timestamp)
-        return timestamps
+        hours_offsets = np.arange(1, num_points + 1) * (hours_ahead / num_points)
+        # Rounded to microseconds, the resolution of datetime/timedelta
+        offsets = pd.to_timedelta(hours_offsets, unit='h').round('us')
+        return (pd.Timestamp(cutoff_time) + offsets).to_pydatetime().tolist()
     
     def _safe_predict(self, df: pd.DataFrame, cutoff_time: datetime, 
                      hours_ahead: int, num_points: int = 20) -> Tuple[List[datetime], List[float]]:
@@ -3,7 +3,11 @@ Model factory - registers and manages all prediction models
 This is the ONLY file that needs to be updated when adding new models
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Tuple
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
@@ -16,6 +20,35 @@ from .linear_trend_predictor import LinearTrendPredictor
 # from .random_forest_predictor import RandomForestPredictor
 # from .transformer_predictor import TransformerPredictor
 from .xgboost_multi_output_predictor import XGBoostMultiOutputPredictor
+
+# Number of recent predictions kept by ModelFactory.predict
+PREDICTION_CACHE_SIZE = 256
+
+
+def _frame_fingerprint(df: pd.DataFrame) -> Tuple:
+    """
+    Content-based key for the numeric and datetime columns of a DataFrame
+
+    Models only compute from those columns (text columns such as 'unit' are
+    labels), and hashing their raw bytes is far cheaper than hashing strings.
+    Extension dtypes (nullable, pyarrow-backed, tz-aware) have no raw NumPy
+    buffer and are hashed with pandas instead.
+    """
+    digest = hashlib.sha1(usedforsecurity=False)
+    for column, dtype in df.dtypes.items():
+        if isinstance(dtype, np.dtype):
+            if dtype.kind not in "biufcmM":
+                continue
+            data = df[column].to_numpy()
+        elif pd.api.types.is_string_dtype(dtype):
+            continue
+        else:
+            data = pd.util.hash_pandas_object(df[column], index=False).to_numpy()
+        digest.update(str(column).encode())
+        digest.update(np.ascontiguousarray(data).view(np.uint8))
+    return len(df), digest.hexdigest()
+
+
 class ModelFactory:
 
     """
@@ -42,12 +75,21 @@ class ModelFactory:
             "XGBoost Multi-Output Predictor": XGBoostMultiOutputPredictor,
         }
         
+        # Model names in registration order, built once for the dropdown
+        self._available = tuple(self._models.keys())
+        
         # Cache instantiated models for performance
         self._model_instances = {}
+
+        # Recent prediction results, least recently used first. Models are
+        # deterministic for a given input, and Streamlit reruns the whole
+        # script on every interaction, so the same request repeats often.
+        self._prediction_cache: "OrderedDict[Tuple, Tuple[Tuple[datetime, ...], Tuple[float, ...]]]" = OrderedDict()
+        self._prediction_cache_lock = threading.Lock()
     
-    def get_available_models(self) -> List[str]:
-        """Get list of available model names for the dropdown"""
-        return list(self._models.keys())
+    def get_available_models(self) -> Tuple[str, ...]:
+        """Get the available model names for the dropdown"""
+        return self._available
     
     def get_model(self, model_name: str):
         """Get a model instance (cached for performance)"""
@@ -77,14 +119,31 @@ class ModelFactory:
             (timestamps, predicted_values)
         """
         model = self.get_model(model_name)
-        return model._safe_predict(df, cutoff_time, hours_ahead, num_points)
+        key = (model_name, _frame_fingerprint(df), cutoff_time, hours_ahead, num_points)
+
+        with self._prediction_cache_lock:
+            cached = self._prediction_cache.get(key)
+            if cached is not None:
+                self._prediction_cache.move_to_end(key)
+
+        if cached is None:
+            timestamps, values = model._safe_predict(df, cutoff_time, hours_ahead, num_points)
+            cached = (tuple(timestamps), tuple(values))
+            with self._prediction_cache_lock:
+                self._prediction_cache[key] = cached
+                while len(self._prediction_cache) > PREDICTION_CACHE_SIZE:
+                    self._prediction_cache.popitem(last=False)
+
+        # Hand out lists, as the models do; the cached tuples stay untouched
+        timestamps, values = cached
+        return list(timestamps), list(values)
 
 # Global factory instance
 model_factory = ModelFactory()
 
 # Convenience functions for the dashboard
-def get_available_models() -> List[str]:
-    """Get list of available model names"""
+def get_available_models() -> Tuple[str, ...]:
+    """Get the available model names"""
     return model_factory.get_available_models()
 
 def generate_predictions(model_name: str, df: pd.DataFrame, cutoff_time: datetime, 
@@ -1,10 +1,205 @@
+import json
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import List, Tuple
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
 from .base_model import BasePredictor
 import joblib
 
+MODEL_PATH = Path(__file__).parent / "trained" / "xgboost_best_mode.pkl"
+
+# Spacing of the regular grid sensor histories are resampled onto
+RESAMPLE_STEP = pd.Timedelta(minutes=5)
+
+# Periods of minute, hour, day of week and month, and the feature columns
+# derived from them (in the column order the model was trained with)
+CYCLE_PERIODS = np.array([60, 24, 7, 12], dtype=np.float32)
+CYCLICAL_FEATURES = [
+    "minute_sin", "minute_cos",
+    "hour_sin", "hour_cos",
+    "day_sin", "day_cos",
+    "month_sin", "month_cos",
+]
+
+
+@lru_cache(maxsize=1)
+def _load_model():
+    """Load the trained model from disk at most once per process"""
+    model = joblib.load(MODEL_PATH)
+
+    # Prediction batches are tiny (num_points rows), so OpenMP thread-pool
+    # setup costs more than it saves - pin every booster to a single thread.
+    # The model was trained on GPU; predict on the CPU the input lives on.
+    for estimator in getattr(model, "estimators_", [model]):
+        if hasattr(estimator, "get_booster"):  # xgboost sklearn wrapper
+            estimator.set_params(n_jobs=1, device="cpu")
+        elif hasattr(estimator, "set_param"):  # raw xgboost Booster
+            estimator.set_param({"nthread": 1, "device": "cpu"})
+
+    return model
+
+
+def _prediction_boosters(model) -> Optional[List[Tuple[object, Tuple[int, int]]]]:
+    """
+    (Booster, iteration_range) for each model output, or None if the model
+    isn't built from XGBoost boosters
+
+    Booster.inplace_predict takes the NumPy input directly, skipping the
+    sklearn wrappers' validation and DMatrix construction.
+    """
+    boosters = []
+    for estimator in getattr(model, "estimators_", [model]):
+        if hasattr(estimator, "get_booster"):  # xgboost sklearn wrapper
+            # Same trees the wrapper's predict() uses after early stopping
+            best_iteration = getattr(estimator, "best_iteration", None)
+            iteration_range = (0, best_iteration + 1) if best_iteration is not None else (0, 0)
+            boosters.append((estimator.get_booster(), iteration_range))
+        elif hasattr(estimator, "inplace_predict"):  # raw xgboost Booster
+            boosters.append((estimator, (0, 0)))
+        else:
+            return None
+    return boosters
+
+
+def _compiled_lib_path(index: int) -> Path:
+    """Shared library holding the compiled booster for one model output"""
+    return MODEL_PATH.with_name(f"{MODEL_PATH.stem}.target{index}.so")
+
+
+def export_compiled_model(toolchain: str = "gcc") -> List[Path]:
+    """
+    Compile each output's booster to a native shared library with Treelite
+
+    Run once after (re)training, e.g.
+        python -c "from models.xgboost_multi_output_predictor import export_compiled_model; export_compiled_model()"
+    Requires the optional treelite and tl2cgen packages and a C compiler.
+    """
+    try:
+        import tl2cgen
+        import treelite
+    except ImportError as e:
+        raise ImportError("export_compiled_model needs the optional treelite and tl2cgen packages") from e
+
+    boosters = _prediction_boosters(_load_model())
+    if boosters is None:
+        raise ValueError("Only models built from XGBoost boosters can be compiled")
+    # Treelite applies the first target's base_score to every target of a
+    # multi-target booster, so only one-output-per-booster models compile
+    for booster, _ in boosters:
+        config = json.loads(booster.save_config())
+        if int(config["learner"]["learner_model_param"].get("num_target", "1")) > 1:
+            raise ValueError("Only models with one booster per output can be compiled")
+
+    paths = []
+    for index, (booster, iteration_range) in enumerate(boosters):
+        # Compile the same trees the booster path predicts with
+        if iteration_range != (0, 0):
+            booster = booster[iteration_range[0]:iteration_range[1]]
+        path = _compiled_lib_path(index)
+        tl2cgen.export_lib(treelite.frontend.from_xgboost(booster), toolchain=toolchain,
+                           libpath=path, params={"parallel_comp": 8})
+        paths.append(path)
+    return paths
+
+
+@lru_cache(maxsize=1)
+def _load_compiled_model():
+    """Load the compiled per-output predictors, or None if unavailable or stale"""
+    paths = []
+    while _compiled_lib_path(len(paths)).exists():
+        paths.append(_compiled_lib_path(len(paths)))
+
+    model_mtime = MODEL_PATH.stat().st_mtime
+    if not paths or any(path.stat().st_mtime < model_mtime for path in paths):
+        return None
+
+    # Imported only once libraries exist, so normal startup doesn't pay for it
+    try:
+        import tl2cgen
+    except ImportError:
+        return None
+    return [tl2cgen.Predictor(path, nthread=1) for path in paths]
+
+
+def _predict_compiled(predictor, X: np.ndarray) -> np.ndarray:
+    """Run one compiled predictor on a float32 feature matrix"""
+    import tl2cgen  # Already loaded by _load_compiled_model
+
+    return predictor.predict(tl2cgen.DMatrix(X)).reshape(len(X))
+
+
+def _cyclical_features(index: pd.DatetimeIndex) -> np.ndarray:
+    """(N, 8) float32 sin/cos features of index, in CYCLICAL_FEATURES order"""
+    # All 8 features in one pass over an (N, 4) matrix of time parts
+    time_parts = np.stack([index.minute, index.hour, index.dayofweek, index.month], axis=1).astype(np.float32)
+    angles = (2 * np.pi) * time_parts / CYCLE_PERIODS
+    features = np.empty((len(index), 2 * len(CYCLE_PERIODS)), dtype=np.float32)
+    features[:, 0::2] = np.sin(angles)
+    features[:, 1::2] = np.cos(angles)
+    return features
+
+
+def _resample_to_grid(timestamps: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Resample (N, k) values onto a regular grid of RESAMPLE_STEP bins
+
+    Equivalent to resample(RESAMPLE_STEP).mean().interpolate(method='time'):
+    each bin holds the mean of its readings, empty bins are interpolated
+    linearly in time, trailing gaps carry the last mean forward and the
+    rows before a column's first reading stay NaN. Returns the grid's bin
+    start times as int64 nanoseconds and the (T, k) grid.
+    """
+    present = ~np.isnat(timestamps)
+    ts = timestamps[present].astype('datetime64[ns]').astype(np.int64)
+    values = values[present]
+    if len(ts) == 0:
+        return np.empty(0, dtype=np.int64), np.empty((0, values.shape[1]))
+
+    step = RESAMPLE_STEP.value
+    bins = ts // step
+    first_bin = bins.min()
+    positions = bins - first_bin
+    n_bins = int(positions.max()) + 1
+    grid_ts = (first_bin + np.arange(n_bins)) * step
+
+    grid = np.full((n_bins, values.shape[1]), np.nan)
+    for k in range(values.shape[1]):
+        valid = ~np.isnan(values[:, k])
+        counts = np.bincount(positions[valid], minlength=n_bins)
+        filled = counts > 0
+        if not filled.any():
+            continue
+        sums = np.bincount(positions[valid], weights=values[valid, k], minlength=n_bins)
+        grid[:, k] = np.interp(grid_ts, grid_ts[filled], sums[filled] / counts[filled])
+        grid[:np.argmax(filled), k] = np.nan
+    return grid_ts, grid
+
+
+def _future_timestamps(start_time: datetime, hours_ahead: int, num_points: int) -> pd.DatetimeIndex:
+    """num_points timestamps after start_time, a whole number of minutes apart"""
+    interval_minutes = (hours_ahead * 60) // num_points
+    # Offsets built as one array (date_range can't express a zero interval)
+    offsets = pd.to_timedelta(np.arange(1, num_points + 1) * interval_minutes, unit='min')
+    return pd.Timestamp(start_time) + offsets
+
+
+@lru_cache(maxsize=128)
+def _build_future_features(cutoff_ts_epoch: int, hours_ahead: int,
+                           num_points: int) -> Tuple[Tuple[datetime, ...], np.ndarray]:
+    """
+    Future timestamps after a cutoff and their cyclical features
+
+    These depend only on the arguments, so they are memoized: re-rendering the
+    dashboard with the same slider state only re-runs the model itself.
+    cutoff_ts_epoch is the cutoff as nanoseconds since the epoch.
+    """
+    timestamps = _future_timestamps(pd.Timestamp(cutoff_ts_epoch), hours_ahead, num_points)
+    features = _cyclical_features(timestamps)
+    features.flags.writeable = False  # Shared between calls
+    return tuple(timestamps.to_pydatetime()), features
+
 
 class XGBoostMultiOutputPredictor(BasePredictor):
     """
@@ -14,7 +209,6 @@ class XGBoostMultiOutputPredictor(BasePredictor):
 
     def __init__(self):
         super().__init__("XGBoost Multi-Output Predictor")
-        self.model = joblib.load('models/trained/xgboost_best_mode.pkl')
 
         # Mapping from dashboard parameter to internal column name
         self.param_map = {
@@ -25,6 +219,51 @@ class XGBoostMultiOutputPredictor(BasePredictor):
             "Illuminance": "currentIlluminance"
         }
 
+        # (fingerprint, grid timestamps, grid values) of the last input frame
+        self._grid_cache = None
+
+    @cached_property
+    def model(self):
+        """Trained model, loaded lazily on first prediction"""
+        return _load_model()
+
+    @cached_property
+    def compiled_model(self):
+        """Treelite-compiled predictors per output, when they have been exported"""
+        return _load_compiled_model()
+
+    @cached_property
+    def boosters(self):
+        """Underlying XGBoost boosters per output, if the model exposes them"""
+        return _prediction_boosters(self.model)
+
+    def _predict_outputs(self, X: np.ndarray) -> np.ndarray:
+        """Predict all model outputs for a contiguous float32 feature matrix"""
+        if self.compiled_model is not None:
+            return np.column_stack([_predict_compiled(p, X) for p in self.compiled_model])
+
+        if self.boosters is not None:
+            return np.column_stack([booster.inplace_predict(X, iteration_range=iteration_range)
+                                    for booster, iteration_range in self.boosters])
+
+        return self.model.predict(X)
+
+    def _predict_target(self, X: np.ndarray, index: int) -> np.ndarray:
+        """Predict one model output, running only its trees when it has its own estimator"""
+        # Checked first so the pickled model is never loaded when compiled
+        # libraries (one per output, see export_compiled_model) are in use
+        if self.compiled_model is not None:
+            return _predict_compiled(self.compiled_model[index], X)
+
+        if not hasattr(self.model, "estimators_"):  # Single multi-output model
+            return self._predict_outputs(X)[:, index]
+
+        if self.boosters is not None:
+            booster, iteration_range = self.boosters[index]
+            return booster.inplace_predict(X, iteration_range=iteration_range)
+
+        return self.model.estimators_[index].predict(X)
+
     def predict(self, df: pd.DataFrame, cutoff_time: datetime,
                 hours_ahead: int, num_points: int = 20, parameter: str = "Temperature") -> Tuple[List[datetime], List[float]]:
 
@@ -36,54 +275,54 @@ class XGBoostMultiOutputPredictor(BasePredictor):
         # Columns used for model input
         target_columns = list(self.param_map.values())
 
-        # 1. Time series preparation
-        df = df.set_index('timestamp').sort_index()
-        df = df[target_columns].resample('5min').mean()
-        df = df.interpolate(method='time')
+        # 1. Time series on a regular 5-minute grid (cached per input frame)
+        grid_ts, grid = self._resampled_grid(df, target_columns)
 
-        # 2. Add cyclical time features
-        df = self.engineer_features(df)
-
-        # 3. Select history before cutoff
-        history = df[df.index <= cutoff_time]
-        if history.empty:
+        # 2. Select history before cutoff
+        cutoff_ns = pd.Timestamp(cutoff_time).value
+        n_history = np.searchsorted(grid_ts, cutoff_ns, side='right')
+        if n_history == 0:
             raise ValueError("No data available before cutoff_time")
 
-        # 4. Create time-aware prediction input
-        last_row = history.iloc[-1]
-        sensor_values = last_row[target_columns].values
-        future_timestamps = self._generate_timestamps(cutoff_time, hours_ahead, num_points)
-        X_pred = pd.DataFrame([sensor_values] * num_points, columns=target_columns)
-        X_pred.index = future_timestamps
-        X_pred = self.engineer_features(X_pred)
+        # 3. Create time-aware prediction input
+        # (time features of the future rows are cached per cutoff and horizon)
+        future_timestamps, time_features = _build_future_features(cutoff_ns, hours_ahead, num_points)
+
+        # Fill one contiguous float32 matrix - the layout and dtype XGBoost
+        # uses internally, so the model does not have to convert it again
+        n_sensors = len(target_columns)
+        X_pred = np.empty((num_points, n_sensors + time_features.shape[1]), dtype=np.float32)
+        X_pred[:, :n_sensors] = grid[n_history - 1]
+        X_pred[:, n_sensors:] = time_features
 
-        # 5. Model prediction
-        y_pred = self.model.predict(X_pred)
+        # 4. Model prediction of only the selected variable
+        y_pred = self._predict_target(X_pred, target_columns.index(target_col))
 
-        # 6. Return only selected variable
-        idx = target_columns.index(target_col)
-        return future_timestamps, y_pred[:, idx].tolist()
+        return list(future_timestamps), y_pred.tolist()
+
+    def _resampled_grid(self, df: pd.DataFrame, columns: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """5-minute grid of df[columns], reused while the same data is passed in"""
+        frame = df[['timestamp', *columns]]
+        key = int(pd.util.hash_pandas_object(frame, index=False).sum())
+        cached = self._grid_cache
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+
+        grid_ts, grid = _resample_to_grid(frame['timestamp'].to_numpy(dtype='datetime64[ns]'),
+                                          frame[columns].to_numpy(dtype=np.float64))
+        grid.flags.writeable = False  # Shared between calls
+        self._grid_cache = (key, grid_ts, grid)
+        return grid_ts, grid
 
     def engineer_features(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
-        df = df.sort_index()  # Ensure time order
-        df['minute'] = df.index.minute
-        df['hour'] = df.index.hour
-        df['day_of_week'] = df.index.dayofweek
-        df['month'] = df.index.month
-
-        df['minute_sin'] = np.sin(2 * np.pi * df['minute'] / 60)
-        df['minute_cos'] = np.cos(2 * np.pi * df['minute'] / 60)
-        df['hour_sin'] = np.sin(2 * np.pi * df['hour'] / 24)
-        df['hour_cos'] = np.cos(2 * np.pi * df['hour'] / 24)
-        df['day_sin'] = np.sin(2 * np.pi * df['day_of_week'] / 7)
-        df['day_cos'] = np.cos(2 * np.pi * df['day_of_week'] / 7)
-        df['month_sin'] = np.sin(2 * np.pi * df['month'] / 12)
-        df['month_cos'] = np.cos(2 * np.pi * df['month'] / 12)
-
-        return df.drop(columns=['minute', 'hour', 'day_of_week', 'month'])
+        # Callers already pass time-ordered frames; only sort if one doesn't
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+
+        # assign() returns a new frame, so the caller's frame is never modified
+        features = _cyclical_features(df.index)
+        return df.assign(**dict(zip(CYCLICAL_FEATURES, features.T)))
 
     def _generate_timestamps(self, start_time: datetime, hours_ahead: int, num_points: int) -> List[datetime]:
-        interval_minutes = (hours_ahead * 60) // num_points
-        return [start_time + pd.Timedelta(minutes=interval_minutes * (i + 1)) for i in range(num_points)]
+        return _future_timestamps(start_time, hours_ahead, num_points).to_pydatetime().tolist()
 
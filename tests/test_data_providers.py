@@ -3,6 +3,9 @@ import pytest
 from datetime import datetime, timedelta
 
 from data.mock_provider import MockDataProvider
+from data.homeassistant_connector import HomeAssistantConnector
+from data.processor import DataProcessor
+from data.models import to_arrays
 
 def test_mock_provider_basic():
     """Test basic mock provider functionality"""
@@ -21,5 +24,74 @@ def test_mock_data_generation():
     
     data = provider.fetch_sensor_data("Wohnzimmer", "co2", start_time, end_time)
     
-    # Will be implemented when mock provider is complete
-    # assert len(data) > 0
+    assert len(data) == 13  # every 5 minutes, both ends inclusive
+    assert data[0].timestamp == start_time
+    assert all(r.unit == "ppm" for r in data)
+
+def test_mock_provider_csv_readings():
+    """Test readings built from the bundled CSV data"""
+    provider = MockDataProvider()
+    room = provider.get_available_rooms()[0]
+    
+    data = provider.fetch_sensor_data(room, "co2", datetime(2024, 10, 1), datetime(2024, 10, 2))
+    
+    assert len(data) > 0
+    assert all(isinstance(r.value, float) for r in data)
+    assert all(r.room == room and r.unit == "ppm" for r in data)
+    assert data[0].timestamp <= data[-1].timestamp
+
+def test_mock_provider_dataframe_matches_readings():
+    """Test DataFrame fetch agrees with the SensorReading fetch"""
+    provider = MockDataProvider()
+    room = provider.get_available_rooms()[0]
+    start_time, end_time = datetime(2024, 10, 1), datetime(2024, 10, 2)
+    
+    df = provider.fetch_sensor_dataframe(room, "temperature", start_time, end_time)
+    readings = provider.fetch_sensor_data(room, "temperature", start_time, end_time)
+    
+    assert list(df.columns) == ['timestamp', 'value', 'unit']
+    assert df['value'].tolist() == [r.value for r in readings]
+
+def test_homeassistant_connection_status_cached(monkeypatch):
+    """Test repeated is_connected calls reuse the last connection test"""
+    calls = []
+    
+    def fake_get(*args, **kwargs):
+        calls.append(args)
+        raise ConnectionError("offline")
+    
+    connector = HomeAssistantConnector("localhost", 8123, "token")
+    monkeypatch.setattr(connector._probe_session, "get", fake_get)
+    
+    assert connector.is_connected() == False
+    assert connector.get_available_rooms() == []
+    assert connector.get_available_parameters("Wohnzimmer") == []
+    assert len(calls) == 1
+
+def test_sensor_series_to_dataframe():
+    """Test SensorSeries converts like the equivalent list of readings"""
+    provider = MockDataProvider()
+    room = provider.get_available_rooms()[0]
+    
+    series = provider.fetch_sensor_data(room, "humidity", datetime(2024, 10, 1), datetime(2024, 10, 2))
+    from_series = DataProcessor.readings_to_dataframe(series)
+    from_list = DataProcessor.readings_to_dataframe(list(series))
+    
+    assert list(from_series.columns) == ['timestamp', 'room', 'parameter', 'value', 'unit']
+    assert from_series['value'].tolist() == from_list['value'].tolist()
+    assert (from_series['room'] == room).all()
+
+def test_to_arrays_sorts_and_matches_series():
+    """Test to_arrays gives time-ordered arrays for lists and SensorSeries"""
+    provider = MockDataProvider()
+    room = provider.get_available_rooms()[0]
+    
+    series = provider.fetch_sensor_data(room, "humidity", datetime(2024, 10, 1), datetime(2024, 10, 2))
+    readings = list(series)[::-1]
+    
+    list_times, list_values = to_arrays(readings)
+    series_times, series_values = to_arrays(series)
+    
+    assert list_times.tolist() == series_times.tolist()
+    assert list_values.tolist() == series_values.tolist()
+    assert (list_times[1:] >= list_times[:-1]).all()
@@ -0,0 +1,101 @@
+"""Tests for prediction models"""
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.model_factory import ModelFactory, _frame_fingerprint
+import models.xgboost_multi_output_predictor as xgb_module
+from models.xgboost_multi_output_predictor import XGBoostMultiOutputPredictor, _resample_to_grid
+
+def test_xgboost_booster_path_matches_model_predict():
+    """Test inplace_predict on the boosters gives the wrapped model's predictions"""
+    predictor = XGBoostMultiOutputPredictor()
+    predictor.compiled_model = None  # Compare the booster path itself
+    n_features = predictor.model.estimators_[0].n_features_in_
+    X = np.random.default_rng(0).normal(size=(20, n_features)).astype(np.float32)
+
+    assert predictor.boosters is not None
+    np.testing.assert_array_equal(predictor._predict_outputs(X), predictor.model.predict(X))
+
+def test_xgboost_single_target_matches_full_prediction():
+    """Test predicting one output matches that column of the full prediction"""
+    predictor = XGBoostMultiOutputPredictor()
+    predictor.compiled_model = None
+    n_features = predictor.model.estimators_[0].n_features_in_
+    X = np.random.default_rng(1).normal(size=(20, n_features)).astype(np.float32)
+
+    full = predictor.model.predict(X)
+    for index in (0, 3):
+        np.testing.assert_array_equal(predictor._predict_target(X, index), full[:, index])
+
+def test_compiled_per_output_libraries(tmp_path, monkeypatch):
+    """Test compiled libraries match XGBoost, and multi-target boosters are refused"""
+    pytest.importorskip("tl2cgen")
+    pytest.importorskip("treelite")
+    xgboost = pytest.importorskip("xgboost")
+    from sklearn.multioutput import MultiOutputRegressor
+    
+    rng = np.random.default_rng(4)
+    X = rng.normal(size=(200, 5)).astype(np.float32)
+    y = np.column_stack([X[:, 0] + X[:, 1], X[:, 2] * 2])
+    per_output = MultiOutputRegressor(xgboost.XGBRegressor(n_estimators=5, max_depth=3)).fit(X, y)
+    multi_target = xgboost.XGBRegressor(n_estimators=5, max_depth=3).fit(X, y)
+    
+    monkeypatch.setattr(xgb_module, "MODEL_PATH", tmp_path / "model.pkl")
+    try:
+        joblib.dump(multi_target, xgb_module.MODEL_PATH)
+        xgb_module._load_model.cache_clear()
+        with pytest.raises(ValueError):
+            xgb_module.export_compiled_model()
+        
+        joblib.dump(per_output, xgb_module.MODEL_PATH)
+        xgb_module._load_model.cache_clear()
+        assert len(xgb_module.export_compiled_model()) == 2
+        predictor = XGBoostMultiOutputPredictor()
+        assert predictor.compiled_model is not None
+        
+        expected = per_output.predict(X[:20])
+        np.testing.assert_allclose(predictor._predict_outputs(X[:20]), expected, atol=1e-5)
+        for index in range(2):
+            np.testing.assert_allclose(predictor._predict_target(X[:20], index), expected[:, index], atol=1e-5)
+    finally:
+        xgb_module._load_model.cache_clear()
+        xgb_module._load_compiled_model.cache_clear()
+
+def test_resample_to_grid_matches_pandas():
+    """Test the numpy resample matches resample('5min').mean().interpolate(method='time')"""
+    rng = np.random.default_rng(3)
+    for trial in range(50):
+        n = int(rng.integers(2, 300))
+        # Random seconds over 30 hours: gaps between bins and several readings per bin
+        seconds = rng.integers(0, 60 * 60 * 30, n)
+        seconds[:2] = [0, 1]  # At least one duplicate bin
+        timestamps = pd.Timestamp("2025-03-01 13:17:11") + pd.to_timedelta(seconds, unit='s')
+        values = rng.normal(size=(n, 4))
+        values[rng.random((n, 4)) < 0.3] = np.nan
+        values[:, 2] = np.nan  # All-NaN column
+        values[np.argsort(seconds)[:n // 2], 1] = np.nan  # Leading NaNs
+
+        expected = pd.DataFrame(values, index=timestamps).sort_index()
+        expected = expected.resample('5min').mean().interpolate(method='time')
+        grid_ts, grid = _resample_to_grid(timestamps.values, values)
+
+        np.testing.assert_array_equal(
+            grid_ts, expected.index.values.astype('datetime64[ns]').astype(np.int64))
+        np.testing.assert_allclose(grid, expected.to_numpy(), rtol=1e-12, atol=1e-12)
+
+def test_prediction_cache_keys_on_extension_dtype_values():
+    """Test cached predictions notice value changes in extension-dtype columns"""
+    factory = ModelFactory()
+    timestamps = pd.date_range("2025-01-01", periods=12, freq="5min")
+    cutoff = timestamps[-1].to_pydatetime()
+    
+    df = pd.DataFrame({"timestamp": timestamps, "value": pd.array(np.arange(12.0) + 20, dtype="Float64")})
+    scaled = df.assign(value=df["value"] * 10)
+    assert factory.predict("Constant Value", df, cutoff, 1, 4)[1][0] == 31.0
+    assert factory.predict("Constant Value", scaled, cutoff, 1, 4)[1][0] == 310.0
+    
+    tz_df = df.assign(timestamp=timestamps.tz_localize("UTC"))
+    shifted = tz_df.assign(timestamp=tz_df["timestamp"] - pd.Timedelta(minutes=5))
+    assert _frame_fingerprint(tz_df) != _frame_fingerprint(shifted)
@@ -0,0 +1,35 @@
+"""Tests for plot generation"""
+from datetime import datetime, timedelta
+
+from data.models import SensorReading, PredictionData
+from ui.plotting import PlotGenerator
+
+def _closest_errors(actual_data, predictions):
+    """Errors the original min() loop produced: ties go to the first-listed prediction"""
+    errors = []
+    for actual in actual_data:
+        closest = min(predictions, key=lambda p: abs((p.timestamp - actual.timestamp).total_seconds()))
+        if abs((closest.timestamp - actual.timestamp).total_seconds()) <= 1800:
+            errors.append(abs(actual.value - closest.predicted_value))
+    return errors
+
+def test_error_plot_matches_closest_prediction():
+    """Test error matching on equidistant and duplicate prediction timestamps"""
+    t0 = datetime(2025, 1, 1)
+    actual_data = [
+        SensorReading(timestamp=t0 + timedelta(minutes=m), room="r", parameter="co2", value=500.0 + m, unit="ppm")
+        for m in (0, 5, 10, 15, 20, 25, 30, 90)
+    ]
+    # Minute 10 is equidistant from 5 and 15, minute 20 from 15 and 25;
+    # minutes 15 and 25 each have two predictions. Listed out of time order.
+    pred_minutes = [25, 15, 5, 25, 15]
+    predictions = [
+        PredictionData(timestamp=t0 + timedelta(minutes=m), predicted_value=400.0 + 10 * i, model_name="m")
+        for i, m in enumerate(pred_minutes)
+    ]
+    
+    fig = PlotGenerator().create_error_plot(actual_data, predictions)
+    expected = _closest_errors(actual_data, predictions)
+    
+    assert len(expected) == 7  # Minute 90 is outside the 30-minute window
+    assert list(fig.data[0].y) == expected
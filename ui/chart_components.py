@@ -2,11 +2,20 @@
 Chart creation components for the sensor dashboard
 """
 
+import streamlit as st
 import plotly.graph_objects as go
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from config.settings import Config
+from typing import Tuple
 from models.model_factory import generate_predictions
+from utils.helpers import get_parameter_display
+
+def _df_fingerprint(df: pd.DataFrame) -> tuple:
+    """Cheap cache key for a sorted sensor DataFrame (avoids hashing every row)"""
+    if df.empty:
+        return (df.shape,)
+    return (df.shape, df['timestamp'].iat[0], df['timestamp'].iat[-1])
 
 def create_sensor_chart(df: pd.DataFrame, cutoff_position: float, predictor_type: str, 
                        forecast_hours: int, parameter: str, room: str) -> go.Figure:
@@ -15,26 +24,47 @@ def create_sensor_chart(df: pd.DataFrame, cutoff_position: float, predictor_type
     if df is None or df.empty:
         return create_empty_chart("No data to display")
     
-    # Get parameter configuration
-    param_config = Config.SENSOR_PARAMETERS.get(parameter, {})
-    unit = param_config.get('unit', '')
-    display_name = param_config.get('display_name', parameter.title())
+    figure = _build_chart(_df_fingerprint(df), cutoff_position, predictor_type,
+                          forecast_hours, parameter, room, _df=df)
+    return go.Figure(figure)
+
+@st.cache_data(max_entries=32)
+def _build_chart(df_fingerprint: tuple, cutoff_position: float, predictor_type: str,
+                 forecast_hours: int, parameter: str, room: str, _df: pd.DataFrame) -> dict:
+    """
+    Build the chart as a figure dict
+    
+    Cached on the cheap fingerprint of the data rather than its contents
+    (_df is not hashed), so reruns from unrelated widgets reuse the figure.
+    """
+    training, validation, pred_times, pred_values, cutoff_time = prepare_chart_data(
+        _df, cutoff_position, predictor_type, forecast_hours, parameter
+    )
+    fig = build_base_chart(parameter, room)
+    _, unit, _ = get_parameter_display(parameter)
+    fig = overlay_prediction(fig, training, validation, pred_times, pred_values,
+                             cutoff_time, predictor_type, unit)
+    return fig.to_dict()
+
+def prepare_chart_data(df: pd.DataFrame, cutoff_position: float, predictor_type: str,
+                       forecast_hours: int, parameter: str) -> tuple:
+    """
+    Split the data at the cutoff position and predict from the cutoff
+
+    Returns (training, validation, pred_times, pred_values, cutoff_time),
+    where training and validation are (timestamps, values) array slices.
+    Only called when _build_chart's cache misses; parameter is unused here.
+    """
     
     # Calculate cutoff point based on position (0.0 to 1.0)
+    timestamps = df['timestamp'].to_numpy()
+    values = df['value'].to_numpy(dtype=np.float32)
     cutoff_index = int(len(df) * cutoff_position)
-    cutoff_time = df.iloc[cutoff_index]['timestamp']
-    
-    # Ensure cutoff_time is a proper datetime object
-    if hasattr(cutoff_time, 'to_pydatetime'):
-        cutoff_time = cutoff_time.to_pydatetime()
-    
-    # Split data
-    training_df = df.iloc[:cutoff_index]
-    validation_df = df.iloc[cutoff_index:]
+    cutoff_time = pd.Timestamp(timestamps[cutoff_index]).to_pydatetime()
     
     # Generate predictions using the new model factory
     pred_times, pred_values = [], []
-    if not training_df.empty:
+    if cutoff_index > 0:
         try:
             pred_times, pred_values = generate_predictions(
                 predictor_type, df, cutoff_time, forecast_hours, num_points=20
@@ -46,17 +76,57 @@ def create_sensor_chart(df: pd.DataFrame, cutoff_position: float, predictor_type
     chart_end_time = pred_times[-1] if pred_times else cutoff_time
     
     # Limit validation data to only show up to the end of predictions
-    if not validation_df.empty:
-        validation_df = validation_df[validation_df['timestamp'] <= chart_end_time]
+    # (timestamps are sorted, so the end is found by binary search)
+    end_index = np.searchsorted(timestamps, np.datetime64(chart_end_time), side='right')
+    
+    # Split data as views of the two arrays
+    training = (timestamps[:cutoff_index], values[:cutoff_index])
+    validation = (timestamps[cutoff_index:end_index], values[cutoff_index:end_index])
+    
+    return training, validation, pred_times, pred_values, cutoff_time
+
+def build_base_chart(parameter: str, room: str) -> go.Figure:
+    """Create the chart layout that doesn't depend on the cutoff position"""
+    
+    # Get parameter configuration
+    _, unit, display_name = get_parameter_display(parameter)
     
     # Create figure
     fig = go.Figure()
     
+    # Update layout
+    fig.update_layout(
+        title=f'{display_name} - {room}',
+        xaxis_title='Time',
+        yaxis_title=f'{display_name} ({unit})',
+        height=600,
+        hovermode='x unified',
+        legend=dict(
+            yanchor="top",
+            y=0.99,
+            xanchor="left",
+            x=0.01
+        ),
+        margin=dict(t=50, b=10)  # Minimal bottom margin
+    )
+    
+    return fig
+
+def overlay_prediction(fig: go.Figure, training: Tuple[np.ndarray, np.ndarray],
+                       validation: Tuple[np.ndarray, np.ndarray], pred_times: list,
+                       pred_values: list, cutoff_time: datetime, predictor_type: str,
+                       unit: str) -> go.Figure:
+    """Add the training, validation and prediction traces and the cutoff line"""
+    
+    # Traces get plain NumPy arrays (float32 values), which plotly encodes
+    # without going through pandas and which serialize more compactly
+    
     # Add training data trace
-    if not training_df.empty:
-        fig.add_trace(go.Scatter(
-            x=training_df['timestamp'],
-            y=training_df['value'],
+    training_times, training_values = training
+    if len(training_times):
+        fig.add_trace(go.Scattergl(
+            x=training_times,
+            y=training_values,
             mode='lines',
             name='Training Data',
             line=dict(color='#1f77b4', width=2),
@@ -64,10 +134,11 @@ def create_sensor_chart(df: pd.DataFrame, cutoff_position: float, predictor_type
         ))
     
     # Add validation data trace
-    if not validation_df.empty:
-        fig.add_trace(go.Scatter(
-            x=validation_df['timestamp'],
-            y=validation_df['value'],
+    validation_times, validation_values = validation
+    if len(validation_times):
+        fig.add_trace(go.Scattergl(
+            x=validation_times,
+            y=validation_values,
             mode='lines',
             name='Actual Data',
             line=dict(color='#ff7f0e', width=2),
@@ -76,9 +147,9 @@ def create_sensor_chart(df: pd.DataFrame, cutoff_position: float, predictor_type
     
     # Add predictions trace
     if pred_times and pred_values:
-        fig.add_trace(go.Scatter(
-            x=pred_times,
-            y=pred_values,
+        fig.add_trace(go.Scattergl(
+            x=np.asarray(pred_times, dtype='datetime64[ns]'),
+            y=np.asarray(pred_values, dtype=np.float32),
             mode='lines+markers',
             name=f'Predictions ({predictor_type})',
             line=dict(color='#2ca02c', width=2, dash='dash'),
@@ -89,22 +160,6 @@ def create_sensor_chart(df: pd.DataFrame, cutoff_position: float, predictor_type
     # Add cutoff line
     add_cutoff_line(fig, cutoff_time)
     
-    # Update layout
-    fig.update_layout(
-        title=f'{display_name} - {room}',
-        xaxis_title='Time',
-        yaxis_title=f'{display_name} ({unit})',
-        height=600,
-        hovermode='x unified',
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="left",
-            x=0.01
-        ),
-        margin=dict(t=50, b=10)  # Minimal bottom margin
-    )
-    
     return fig
 
 def add_cutoff_line(fig: go.Figure, cutoff_time: datetime):
@@ -3,11 +3,12 @@ Dashboard UI controls and components
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Tuple, Optional
-from config.settings import Config
 from models.model_factory import get_available_models
+from utils.helpers import get_parameter_display
 
 def create_top_controls(data_provider) -> Tuple[str, str, str, int]:
     """Create the top control bar with room, parameter, predictor, and forecast selection"""
@@ -45,7 +46,7 @@ def create_top_controls(data_provider) -> Tuple[str, str, str, int]:
             "📊 Parameter",
             available_parameters,
             index=available_parameters.index(st.session_state.selected_parameter),
-            format_func=lambda x: Config.SENSOR_PARAMETERS.get(x, {}).get('display_name', x.title())
+            format_func=lambda x: get_parameter_display(x)[2]
         )
         st.session_state.selected_parameter = selected_parameter
     
@@ -85,14 +86,16 @@ def create_analysis_window_controls(df: pd.DataFrame) -> pd.DataFrame:
         )
     
     with col2:
-        # Show the actual time range being analyzed
-        data_end = df['timestamp'].max()
+        # Show the actual time range being analyzed (timestamps are sorted)
+        timestamps = df['timestamp'].to_numpy()
+        data_end = pd.Timestamp(timestamps[-1])
         analysis_start = data_end - timedelta(hours=lookback_hours)
         st.info(f"📅 {analysis_start.strftime('%m-%d %H:%M')} to {data_end.strftime('%m-%d %H:%M')}")
     
     with col3:
         # Show data point count
-        df_windowed = df[df['timestamp'] >= analysis_start]
+        start_index = np.searchsorted(timestamps, analysis_start.to_datetime64(), side='left')
+        df_windowed = df.iloc[start_index:]
         st.metric("Points", len(df_windowed))
     
     return df_windowed
@@ -135,8 +138,6 @@ def create_metrics_display(df: pd.DataFrame, cutoff_position: float, forecast_ho
 
 def initialize_session_state():
     """Initialize all session state variables"""
-    if 'data_provider' not in st.session_state:
-        st.session_state.data_provider = None
     if 'selected_room' not in st.session_state:
         st.session_state.selected_room = None
     if 'selected_parameter' not in st.session_state:
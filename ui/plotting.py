@@ -5,8 +5,8 @@ from typing import List
 from datetime import datetime
 import numpy as np
 
-from data.models import SensorReading, PredictionData
-from config.settings import Config
+from data.models import SensorReading, PredictionData, predictions_to_arrays, to_arrays
+from utils.helpers import get_parameter_display
 
 class PlotGenerator:
     """Generate interactive Plotly charts"""
@@ -29,23 +29,17 @@ class PlotGenerator:
             return fig
         
         # Get parameter configuration
-        param_config = Config.SENSOR_PARAMETERS.get(parameter, {})
-        color = param_config.get('color', '#1f77b4')
-        unit = param_config.get('unit', '')
-        display_name = param_config.get('display_name', parameter.title())
+        color, unit, display_name = get_parameter_display(parameter)
         
-        # Split historical data at cutoff
-        pre_cutoff_data = [r for r in historical_data if r.timestamp <= cutoff_time]
-        post_cutoff_data = [r for r in historical_data if r.timestamp > cutoff_time]
+        # Split historical data at cutoff (readings are in time order)
+        times, values = to_arrays(historical_data)
+        cutoff_index = np.searchsorted(times, np.datetime64(cutoff_time, 'ns'), side='right')
         
         # Plot historical data before cutoff
-        if pre_cutoff_data:
-            times = [r.timestamp for r in pre_cutoff_data]
-            values = [r.value for r in pre_cutoff_data]
-            
-            fig.add_trace(go.Scatter(
-                x=times,
-                y=values,
+        if cutoff_index > 0:
+            fig.add_trace(go.Scattergl(
+                x=times[:cutoff_index],
+                y=values[:cutoff_index].astype(np.float32),
                 mode='lines+markers',
                 name='Historical Data',
                 line=dict(color=color, width=2),
@@ -54,13 +48,10 @@ class PlotGenerator:
             ))
         
         # Plot actual data after cutoff (for validation)
-        if post_cutoff_data:
-            times = [r.timestamp for r in post_cutoff_data]
-            values = [r.value for r in post_cutoff_data]
-            
-            fig.add_trace(go.Scatter(
-                x=times,
-                y=values,
+        if cutoff_index < len(times):
+            fig.add_trace(go.Scattergl(
+                x=times[cutoff_index:],
+                y=values[cutoff_index:].astype(np.float32),
                 mode='lines+markers',
                 name='Actual Data (validation)',
                 line=dict(color='orange', width=2),
@@ -69,14 +60,11 @@ class PlotGenerator:
             ))
         
         # Plot predictions
+        pred_times, pred_values, confidences = predictions_to_arrays(predictions)
         if predictions:
-            pred_times = [p.timestamp for p in predictions]
-            pred_values = [p.predicted_value for p in predictions]
-            confidences = [p.confidence for p in predictions if p.confidence is not None]
-            
-            fig.add_trace(go.Scatter(
+            fig.add_trace(go.Scattergl(
                 x=pred_times,
-                y=pred_values,
+                y=pred_values.astype(np.float32),
                 mode='lines+markers',
                 name='ML Predictions',
                 line=dict(color='green', width=2, dash='dash'),
@@ -85,13 +73,14 @@ class PlotGenerator:
             ))
             
             # Add confidence intervals if available
-            if confidences and len(confidences) == len(pred_times):
-                upper_bound = [v + (1-c) * abs(v) * 0.1 for v, c in zip(pred_values, confidences)]
-                lower_bound = [v - (1-c) * abs(v) * 0.1 for v, c in zip(pred_values, confidences)]
+            if not np.isnan(confidences).any():
+                half_width = (1 - confidences) * np.abs(pred_values) * 0.1
+                upper_bound = pred_values + half_width
+                lower_bound = pred_values - half_width
                 
-                fig.add_trace(go.Scatter(
-                    x=pred_times + pred_times[::-1],
-                    y=upper_bound + lower_bound[::-1],
+                fig.add_trace(go.Scattergl(
+                    x=np.concatenate([pred_times, pred_times[::-1]]),
+                    y=np.concatenate([upper_bound, lower_bound[::-1]]).astype(np.float32),
                     fill='toself',
                     fillcolor='rgba(0,255,0,0.1)',
                     line=dict(color='rgba(255,255,255,0)'),
@@ -102,15 +91,11 @@ class PlotGenerator:
         
         # Add cutoff line
         if historical_data or predictions:
-            all_values = []
-            if historical_data:
-                all_values.extend([r.value for r in historical_data])
-            if predictions:
-                all_values.extend([p.predicted_value for p in predictions])
+            all_values = np.concatenate([values, pred_values])
             
-            if all_values:
-                y_min = min(all_values) * 0.95
-                y_max = max(all_values) * 1.05
+            if all_values.size:
+                y_min = all_values.min() * 0.95
+                y_max = all_values.max() * 1.05
                 
                 fig.add_vline(
                     x=cutoff_time,
@@ -153,15 +138,11 @@ class PlotGenerator:
             return fig
         
         # Get parameter configuration
-        param_config = Config.SENSOR_PARAMETERS.get(parameter, {})
-        unit = param_config.get('unit', '')
-        display_name = param_config.get('display_name', parameter.title())
+        _, unit, display_name = get_parameter_display(parameter)
         
         # Extract values for comparison
-        actual_times = [r.timestamp for r in actual_data]
-        actual_values = [r.value for r in actual_data]
-        pred_times = [p.timestamp for p in predictions]
-        pred_values = [p.predicted_value for p in predictions]
+        actual_times, actual_values = to_arrays(actual_data)
+        pred_times, pred_values, _ = predictions_to_arrays(predictions)
         
         # Plot actual values
         fig.add_trace(go.Scatter(
@@ -207,23 +188,35 @@ class PlotGenerator:
             )
             return fig
         
-        # Calculate errors by finding closest predictions to actual data points
-        errors = []
-        error_times = []
-        
-        for actual in actual_data:
-            # Find closest prediction
-            closest_pred = min(predictions, 
-                             key=lambda p: abs((p.timestamp - actual.timestamp).total_seconds()))
-            
-            # Only include if within reasonable time window (e.g., 30 minutes)
-            time_diff = abs((closest_pred.timestamp - actual.timestamp).total_seconds())
-            if time_diff <= 1800:  # 30 minutes
-                error = abs(actual.value - closest_pred.predicted_value)
-                errors.append(error)
-                error_times.append(actual.timestamp)
-        
-        if errors:
+        # Match each actual reading to its closest prediction in time: binary
+        # search into the sorted prediction times and pick the nearer
+        # neighbour; ties go to the prediction listed first, as with min()
+        pred_times, pred_values, _ = predictions_to_arrays(predictions)
+        pred_times = pred_times.astype(np.int64)
+        order = np.argsort(pred_times, kind='stable')
+        pred_times, pred_values = pred_times[order], pred_values[order]
+        
+        actual_times, actual_values = to_arrays(actual_data)
+        actual_ns = actual_times.astype(np.int64)
+        
+        if len(pred_times) == 1:
+            closest = np.zeros(len(actual_ns), dtype=np.intp)
+        else:
+            right = np.clip(np.searchsorted(pred_times, actual_ns), 1, len(pred_times) - 1)
+            # First of any predictions sharing a timestamp (earliest listed)
+            left = np.searchsorted(pred_times, pred_times[right - 1])
+            right = np.searchsorted(pred_times, pred_times[right])
+            left_diff = np.abs(actual_ns - pred_times[left])
+            right_diff = np.abs(pred_times[right] - actual_ns)
+            take_left = (left_diff < right_diff) | ((left_diff == right_diff) & (order[left] <= order[right]))
+            closest = np.where(take_left, left, right)
+        
+        # Only include if within reasonable time window (e.g., 30 minutes)
+        in_window = np.abs(pred_times[closest] - actual_ns) <= 1800 * 10**9
+        errors = np.abs(actual_values - pred_values[closest])[in_window]
+        error_times = actual_times[in_window]
+        
+        if len(errors):
             fig.add_trace(go.Scatter(
                 x=error_times,
                 y=errors,
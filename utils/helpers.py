@@ -2,6 +2,8 @@
 import logging
 import os
 from datetime import datetime
+from functools import lru_cache
+from typing import Tuple
 from config.settings import Config
 
 def setup_logging():
@@ -22,6 +24,16 @@ def setup_logging():
     logger = logging.getLogger(__name__)
     logger.info("Logging setup complete")
 
+@lru_cache(maxsize=16)
+def get_parameter_display(parameter: str) -> Tuple[str, str, str]:
+    """Chart color, unit and display name of a sensor parameter (cached)"""
+    param_config = Config.SENSOR_PARAMETERS.get(parameter, {})
+    return (
+        param_config.get('color', '#1f77b4'),
+        param_config.get('unit', ''),
+        param_config.get('display_name', parameter.title())
+    )
+
 def format_timestamp(timestamp: datetime) -> str:
     """Format timestamp for display"""
     return timestamp.strftime("%Y-%m-%d %H:%M:%S")